@@ -11,9 +11,10 @@ the request lifecycle.
 """
 
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 # Read the database URL from the environment. For production use a PostgreSQL
@@ -24,14 +25,60 @@ from sqlalchemy.orm import sessionmaker
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./market.db")
 
 # Configure the SQLAlchemy engine. SQLite requires special options for
-# multi‑threaded access. Other backends such as PostgreSQL do not need
-# additional arguments.
+# multi‑threaded access, and an in‑memory database must share a single
+# connection (``StaticPool``) or each session would see an empty database.
+# Other backends such as PostgreSQL get a larger connection pool than the
+# default so concurrent requests do not queue for a connection; stale
+# connections are detected with a ping and recycled every 30 minutes. The
+# pool hands out the most recently returned connection first, which keeps a
+# small set of connections warm and lets surplus ones idle out.
 if DATABASE_URL.startswith("sqlite"):
+    if ":memory:" in DATABASE_URL or DATABASE_URL in {"sqlite://", "sqlite:///"}:
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(
+            DATABASE_URL, connect_args={"check_same_thread": False}
+        )
+else:
     engine = create_engine(
-        DATABASE_URL, connect_args={"check_same_thread": False}
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=40,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
     )
-else:
-    engine = create_engine(DATABASE_URL)
+
+# Tune SQLite for concurrent web traffic: write‑ahead logging lets readers
+# proceed while a bet or resolution is being committed, and
+# ``synchronous=NORMAL`` avoids an fsync on every commit in WAL mode.
+#
+# SQLite ignores ``SELECT ... FOR UPDATE``, and pysqlite only opens a
+# transaction at the first write, so two requests could otherwise read the
+# same balance or share counts and overwrite each other's updates. Instead
+# pysqlite's own transaction handling is switched off and every transaction
+# starts with ``BEGIN IMMEDIATE``, which takes the database's write lock up
+# front; concurrent transactions queue on it (up to pysqlite's default
+# 5 second busy timeout) and always see each other's committed changes.
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=134217728")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
 
 # A session factory bound to our engine. The ``autocommit`` and ``autoflush``
 # options are disabled to give us explicit control over when commits happen.
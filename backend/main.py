@@ -9,52 +9,147 @@ starter template approachable; in a real application, one would use JWTs or
 similar tokens instead of returning the user ID directly.
 """
 
-from typing import List, Optional
-
-from fastapi import Depends, FastAPI, HTTPException, status
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+import bcrypt
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.database import Base, engine, get_db
 from backend.models import User, Market, Bet
-from backend.market_logic import cost_for_shares, price_yes, price_no
-
-import hashlib
+from backend.market_logic import cost_for_shares, price_yes_batch
 
 
-# Create database tables. In production you may want to manage migrations
-# separately using Alembic, but for a quick start this is convenient.
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create any missing tables and indexes when the server starts.
 
-app = FastAPI(title="Prediction Market API", version="0.1.0")
+    Runs once per worker at startup rather than whenever this module is
+    imported. In production you may want to manage migrations separately
+    using Alembic and set ``AUTO_CREATE_TABLES=0`` so workers skip the schema
+    inspection queries on start, but for a quick start this is convenient.
+    """
+    if os.getenv("AUTO_CREATE_TABLES", "1") == "1":
+        Base.metadata.create_all(bind=engine, checkfirst=True)
+        # ``create_all`` only builds indexes together with their table, so add
+        # any indexes introduced after a database was first created.
+        for index in Bet.__table__.indexes:
+            index.create(bind=engine, checkfirst=True)
+    yield
+
+
+# The model-returning endpoints (register, create_market, place_bet,
+# resolve_market and get_user) declare a ``response_model`` and use the
+# default response class, which lets FastAPI serialise their responses
+# straight to JSON bytes with Pydantic's compiled core instead of building
+# dicts for ``json.dumps``. ``/markets`` sends its own pre-serialised bytes
+# and declares its model only for the OpenAPI schema.
+app = FastAPI(title="Prediction Market API", version="0.1.0", lifespan=lifespan)
 
 # Allow all origins by default to facilitate local development and
 # deployment of the frontend on a different host (e.g. GitHub Pages). In a
-# production environment you should restrict this to the domains serving
-# your frontend.
+# production environment set ``ALLOWED_ORIGINS`` to a comma separated list of
+# the domains serving your frontend. Browsers refuse credentialed requests
+# to a wildcard origin, so credentials are only allowed for explicit lists.
+ALLOWED_ORIGINS = sorted(
+    {origin.strip().rstrip("/") for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",") if origin.strip()}
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials="*" not in ALLOWED_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+# Cost factor for new bcrypt hashes. Each increment doubles the work needed
+# to hash or verify a password.
+BCRYPT_ROUNDS = 10
+
+
+# Recent successful bcrypt verifications, so a user logging in repeatedly
+# does not pay the full bcrypt cost each time. Entries are keyed on the stored
+# hash and an HMAC of the password under a per‑process random key, so neither
+# the plaintext nor a plain unsalted digest of it is kept in memory. Only
+# successes are cached, so failed guesses cannot evict real entries.
+_VERIFIED_CACHE_SIZE = 1024
+_verified_cache_key = secrets.token_bytes(32)
+_verified_cache: "OrderedDict[Tuple[str, bytes], None]" = OrderedDict()
+_verified_cache_lock = threading.Lock()
+
+
+def _check_bcrypt(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash, consulting the cache first."""
+    key = (hashed_password, hmac.new(_verified_cache_key, plain_password.encode("utf-8"), hashlib.sha256).digest())
+    with _verified_cache_lock:
+        if key in _verified_cache:
+            _verified_cache.move_to_end(key)
+            return True
+    try:
+        ok = bcrypt.checkpw(_bcrypt_input(plain_password), hashed_password.encode("ascii"))
+    except ValueError:
+        return False
+    if ok:
+        with _verified_cache_lock:
+            _verified_cache[key] = None
+            if len(_verified_cache) > _VERIFIED_CACHE_SIZE:
+                _verified_cache.popitem(last=False)
+    return ok
+
+
+def _bcrypt_input(password: str) -> bytes:
+    """Encode a password for bcrypt, which only reads the first 72 bytes."""
+    return password.encode("utf-8")[:72]
+
+
 def get_password_hash(password: str) -> str:
-    """Compute a SHA‑256 hash of the given password.
+    """Hash a password with bcrypt using a random per‑password salt.
 
-    A proper application should use a stronger hashing algorithm like bcrypt
-    with a salt. This simplified example uses SHA‑256 for brevity and ease of
-    installation. The resulting hex digest is stored in the database.
+    The resulting ``$2b$...`` string embeds the salt and cost factor and is
+    stored in the database as is.
     """
-    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+    hashed = bcrypt.hashpw(_bcrypt_input(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return hashed.decode("ascii")
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return whether a stored hash predates the move to bcrypt."""
+    return not hashed_password.startswith("$2")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its SHA‑256 hash."""
-    return get_password_hash(plain_password) == hashed_password
+    """Verify a password against its stored hash.
+
+    bcrypt hashes are checked with ``bcrypt.checkpw``, skipping the check for
+    recently verified passwords. Anything else is a bare SHA‑256 hex digest
+    written before the switch to bcrypt; it is compared in constant time so
+    response timing does not leak how much of the hash matched, and is
+    upgraded to bcrypt on the next successful login.
+    """
+    if not password_needs_rehash(hashed_password):
+        return _check_bcrypt(plain_password, hashed_password)
+    candidate = hashlib.sha256(plain_password.encode("utf-8")).digest()
+    try:
+        stored = bytes.fromhex(hashed_password)
+    except ValueError:
+        return False
+    return hmac.compare_digest(candidate, stored)
 
 
 # Pydantic models for request and response bodies. These enforce input
@@ -92,8 +187,7 @@ class UserResponse(BaseModel):
     id: int
     username: str
     balance: float
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MarketResponse(BaseModel):
@@ -107,8 +201,7 @@ class MarketResponse(BaseModel):
     outcome: Optional[str]
     price_yes: float
     price_no: float
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BetResponse(BaseModel):
@@ -120,10 +213,16 @@ class BetResponse(BaseModel):
     price: float
     total_cost: float
     timestamp: str
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
+# The endpoints below are plain ``def`` functions, so FastAPI runs each one
+# in its worker threadpool. Password hashing with the deliberately slow
+# bcrypt and the synchronous SQLAlchemy session therefore never block the
+# event loop. Response objects are built with ``model_construct``: every
+# value comes from the database or was already validated on the request
+# model, so re‑running field validation would only repeat work.
+
 @app.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(request: RegisterRequest, db: Session = Depends(get_db)):
     """Create a new user with the provided username and password.
@@ -132,8 +231,8 @@ def register(request: RegisterRequest, db: Session = Depends(get_db)):
     Returns the newly created user's ID, username and balance.
     """
     # Check if the username is already taken
-    existing = db.query(User).filter(User.username == request.username).first()
-    if existing:
+    taken = db.query(User.id).filter(User.username == request.username).exists()
+    if db.query(taken).scalar():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already exists")
 
     user = User(
@@ -142,9 +241,17 @@ def register(request: RegisterRequest, db: Session = Depends(get_db)):
         balance=100.0
     )
     db.add(user)
+    try:
+        # Flushing runs the INSERT, whose RETURNING clause fills in the ID, so
+        # the response can be built without re-reading the row after commit.
+        db.flush()
+    except IntegrityError:
+        # A concurrent registration claimed the name after the check above.
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already exists")
+    response = UserResponse.model_construct(id=user.id, username=user.username, balance=user.balance)
     db.commit()
-    db.refresh(user)
-    return user
+    return response
 
 
 @app.post("/login")
@@ -152,46 +259,158 @@ def login(request: LoginRequest, db: Session = Depends(get_db)):
     """Authenticate a user by username and password.
 
     On success returns a simple dict containing the user's ID and balance.
-    In a production application you'd return a session or JWT token instead.
+    Passwords stored with a legacy hash are rehashed with bcrypt. In a
+    production application you'd return a session or JWT token instead.
     """
-    user = db.query(User).filter(User.username == request.username).first()
-    if not user or not verify_password(request.password, user.password_hash):
+    row = (
+        db.query(User.id, User.username, User.balance, User.password_hash)
+        .filter(User.username == request.username)
+        .first()
+    )
+    if not row or not verify_password(request.password, row.password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid username or password")
-    return {"id": user.id, "username": user.username, "balance": user.balance}
+    if password_needs_rehash(row.password_hash):
+        # The plaintext is only available now, so upgrade legacy hashes here.
+        db.query(User).filter(User.id == row.id).update(
+            {User.password_hash: get_password_hash(request.password)},
+            synchronize_session=False,
+        )
+        db.commit()
+    return {"id": row.id, "username": row.username, "balance": row.balance}
+
+
+def _market_state_version(db: Session) -> Tuple[int, int, int]:
+    """Return a cheap fingerprint of everything ``/markets`` reports.
+
+    Shares only change when a bet is inserted, markets are never edited after
+    creation and resolution flips ``resolved``, so the newest bet ID, the
+    newest market ID and the number of resolved markets change whenever the
+    listing does. All three come back in a single row.
+    """
+    row = db.query(
+        select(func.max(Bet.id)).scalar_subquery(),
+        select(func.max(Market.id)).scalar_subquery(),
+        select(func.count(Market.id)).where(Market.resolved.is_(True)).scalar_subquery(),
+    ).one()
+    return tuple(value or 0 for value in row)
+
+
+def _build_market_list(db: Session) -> List[dict]:
+    """Load every market and price it with the LMSR.
+
+    Only the response columns are selected, as plain rows rather than ORM
+    instances, and the share columns are priced in one vectorised call. The
+    result is a list of plain dicts shaped like ``MarketResponse``, built
+    without any model instances since it goes straight to JSON.
+    """
+    rows = db.execute(
+        select(
+            Market.id,
+            Market.title,
+            Market.description,
+            Market.yes_shares,
+            Market.no_shares,
+            Market.liquidity,
+            Market.resolved,
+            Market.outcome,
+        )
+    ).all()
+    count = len(rows)
+    q_yes = np.fromiter((r.yes_shares for r in rows), dtype=np.float64, count=count)
+    q_no = np.fromiter((r.no_shares for r in rows), dtype=np.float64, count=count)
+    b = np.fromiter((r.liquidity for r in rows), dtype=np.float64, count=count)
+    resolved = np.fromiter(
+        (r.resolved and r.outcome in {"YES", "NO"} for r in rows), dtype=bool, count=count
+    )
+    won_yes = np.fromiter((r.outcome == "YES" for r in rows), dtype=bool, count=count)
+    # If the market is resolved, the price is simply 1 for the winning
+    # outcome and 0 for the losing one.
+    p_yes = np.where(resolved, won_yes.astype(np.float64), price_yes_batch(q_yes, q_no, b))
+    return [
+        {
+            "id": r.id,
+            "title": r.title,
+            "description": r.description,
+            "yes_shares": r.yes_shares,
+            "no_shares": r.no_shares,
+            "liquidity": r.liquidity,
+            "resolved": r.resolved,
+            "outcome": r.outcome,
+            "price_yes": p,
+            "price_no": 1.0 - p,
+        }
+        for r, p in zip(rows, p_yes.tolist())
+    ]
+
+
+# Serialised ``/markets`` payload together with the state version and ETag it
+# was built for and when that version was last checked. Replaced wholesale,
+# so readers on other threads always see a consistent tuple.
+_markets_cache: Tuple[Optional[Tuple[int, int, int]], str, bytes, float] = (None, "", b"", 0.0)
+# Within this many seconds of the last check the cached payload is served
+# without even querying the state version. Writes made through this process
+# drop the cache straight away; writes from other workers show up once the
+# window has passed, which matches the ``max-age`` sent to clients.
+MARKETS_CACHE_TTL = 1.0
+# Bumped by every invalidation. A request only stores what it built if no
+# write committed while it was reading, so a listing read before a write
+# cannot be put back after that write dropped the cache.
+_markets_cache_generation = 0
+_markets_cache_lock = threading.Lock()
+# Hit and miss counts for the ``/markets`` cache, reported by ``/metrics``.
+# Updated under ``_markets_cache_lock`` since requests run on many threads.
+_markets_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _invalidate_markets_cache() -> None:
+    """Forget the cached ``/markets`` payload after a committed write."""
+    global _markets_cache, _markets_cache_generation
+    with _markets_cache_lock:
+        _markets_cache_generation += 1
+        _markets_cache = (None, "", b"", 0.0)
 
 
 @app.get("/markets", response_model=List[MarketResponse])
-def list_markets(db: Session = Depends(get_db)):
+def list_markets(request: Request, db: Session = Depends(get_db)):
     """Return all markets with current prices.
 
-    Prices are computed on the fly using the LMSR cost function. For each
-    market the YES and NO probabilities are added to the response.
+    Prices are computed using the LMSR cost function, vectorised over all
+    markets with NumPy. For each market the YES and NO probabilities are
+    added to the response. The serialised listing is cached until a bet,
+    new market or resolution changes the market state, is reused without
+    touching the database for ``MARKETS_CACHE_TTL`` seconds, and is sent with an
+    ``ETag`` so clients can revalidate with ``If-None-Match`` and receive a
+    bodiless 304 when nothing has changed.
     """
-    markets = db.query(Market).all()
-    response = []
-    for m in markets:
-        b = m.liquidity
-        # If the market is resolved, the price is simply 1 for the winning
-        # outcome and 0 for the losing one.
-        if m.resolved and m.outcome in {"YES", "NO"}:
-            p_yes = 1.0 if m.outcome == "YES" else 0.0
-            p_no = 1.0 - p_yes
+    global _markets_cache
+    with _markets_cache_lock:
+        generation = _markets_cache_generation
+        cached_version, etag, body, checked_at = _markets_cache
+    now = time.monotonic()
+    if cached_version is not None and now - checked_at < MARKETS_CACHE_TTL:
+        outcome = "hits"
+    else:
+        version = _market_state_version(db)
+        if version != cached_version:
+            outcome = "misses"
+            body = to_json(_build_market_list(db))
+            # The version and the listing come from separate statements, so
+            # a bet committed in between can make the body newer than
+            # ``version``. Deriving the ETag from the body itself keeps it
+            # truthful; the stale version only costs one extra rebuild.
+            etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
         else:
-            p_yes = price_yes(m.yes_shares, m.no_shares, b)
-            p_no = 1.0 - p_yes
-        response.append(MarketResponse(
-            id=m.id,
-            title=m.title,
-            description=m.description,
-            yes_shares=m.yes_shares,
-            no_shares=m.no_shares,
-            liquidity=m.liquidity,
-            resolved=m.resolved,
-            outcome=m.outcome,
-            price_yes=p_yes,
-            price_no=p_no
-        ))
-    return response
+            outcome = "hits"
+        with _markets_cache_lock:
+            if _markets_cache_generation == generation:
+                _markets_cache = (version, etag, body, now)
+    with _markets_cache_lock:
+        _markets_cache_stats[outcome] += 1
+
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=1"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.post("/markets", response_model=MarketResponse, status_code=status.HTTP_201_CREATED)
@@ -212,12 +431,11 @@ def create_market(request: MarketCreateRequest, db: Session = Depends(get_db)):
         outcome=None
     )
     db.add(market)
-    db.commit()
-    db.refresh(market)
+    db.flush()
     # Compute initial prices (both 0.5 for a balanced LMSR)
     p_yes = 0.5
     p_no = 0.5
-    return MarketResponse(
+    response = MarketResponse.model_construct(
         id=market.id,
         title=market.title,
         description=market.description,
@@ -229,6 +447,9 @@ def create_market(request: MarketCreateRequest, db: Session = Depends(get_db)):
         price_yes=p_yes,
         price_no=p_no
     )
+    db.commit()
+    _invalidate_markets_cache()
+    return response
 
 
 @app.post("/bet", response_model=BetResponse)
@@ -244,18 +465,27 @@ def place_bet(request: BetRequest, db: Session = Depends(get_db)):
         and total cost. If the user has insufficient funds or the market is
         resolved, an error is raised.
     """
-    user = db.query(User).filter(User.id == request.user_id).first()
+    # Lock the market and then the user until commit, so concurrent bets
+    # cannot read the same balance or share counts and overwrite each
+    # other's updates. The market is locked first because resolve_market
+    # locks the market before updating the winners' balances; taking the
+    # locks in the same order keeps the two from deadlocking. SQLite has no
+    # row locks; there the whole transaction holds the database write lock
+    # (see ``backend.database``).
+    market = db.query(Market).filter(Market.id == request.market_id).with_for_update().first()
+    user = db.query(User).filter(User.id == request.user_id).with_for_update().first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    market = db.query(Market).filter(Market.id == request.market_id).first()
     if not market:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Market not found")
     if market.resolved:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Market is already resolved")
 
     side_upper = request.side.upper()
-    # Compute cost using current share counts and liquidity parameter
+    # Compute cost and price per share using current share counts and
+    # liquidity parameter
     total_cost = cost_for_shares(market.yes_shares, market.no_shares, request.amount, side_upper, market.liquidity)
+    price_per_share = total_cost / request.amount
 
     # Ensure the user can afford the bet
     if user.balance < total_cost:
@@ -270,22 +500,21 @@ def place_bet(request: BetRequest, db: Session = Depends(get_db)):
     # Deduct cost from user's balance
     user.balance -= total_cost
 
-    # Calculate price per share
-    price_per_share = total_cost / request.amount
-
-    # Create Bet record
+    # Create Bet record. The timestamp is set here rather than by the column
+    # default so every response field is known once the INSERT has been
+    # flushed, and the row does not need to be re-read after the commit.
     bet = Bet(
         user_id=user.id,
         market_id=market.id,
         side=side_upper,
         amount=request.amount,
         price=price_per_share,
-        total_cost=total_cost
+        total_cost=total_cost,
+        timestamp=datetime.now(timezone.utc)
     )
     db.add(bet)
-    db.commit()
-    db.refresh(bet)
-    return BetResponse(
+    db.flush()
+    response = BetResponse.model_construct(
         id=bet.id,
         user_id=bet.user_id,
         market_id=bet.market_id,
@@ -295,6 +524,9 @@ def place_bet(request: BetRequest, db: Session = Depends(get_db)):
         total_cost=bet.total_cost,
         timestamp=bet.timestamp.isoformat()
     )
+    db.commit()
+    _invalidate_markets_cache()
+    return response
 
 
 @app.post("/resolve", response_model=MarketResponse)
@@ -303,11 +535,12 @@ def resolve_market(request: ResolveRequest, db: Session = Depends(get_db)):
 
     Once resolved, the market's outcome is fixed and prices become 1 for the
     winning side and 0 for the losing side. All outstanding shares of the
-    winning outcome are redeemed at value 1 and credited back to users. This
-    simplistic implementation iterates over all bets and credits balances
-    accordingly.
+    winning outcome are redeemed at value 1 and credited back to users. Winning
+    shares are summed per user and credited with one bulk update.
     """
-    market = db.query(Market).filter(Market.id == request.market_id).first()
+    # Lock the market so a concurrent bet or resolution waits for this one
+    # (on SQLite the transaction's write lock does the same).
+    market = db.query(Market).filter(Market.id == request.market_id).with_for_update().first()
     if not market:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Market not found")
     if market.resolved:
@@ -320,20 +553,22 @@ def resolve_market(request: ResolveRequest, db: Session = Depends(get_db)):
     market.resolved = True
     market.outcome = outcome_upper
 
-    # Payout winners: iterate through all bets on this market
-    bets = db.query(Bet).filter(Bet.market_id == market.id).all()
-    for bet in bets:
-        # If the bet matches the outcome, credit the user the number of shares
-        if bet.side == outcome_upper:
-            user = db.query(User).filter(User.id == bet.user_id).first()
-            # Credit 1 currency unit per share; total = amount
-            user.balance += bet.amount
-    db.commit()
+    # Payout winners: credit 1 currency unit per winning share. A single
+    # UPDATE adds each winner's summed shares server side, and it is
+    # committed together with the resolution above.
+    winning_bets = (Bet.market_id == market.id, Bet.side == outcome_upper)
+    credit = select(func.sum(Bet.amount)).where(*winning_bets, Bet.user_id == User.id).scalar_subquery()
+    db.query(User).filter(User.id.in_(select(Bet.user_id).where(*winning_bets))).update(
+        {User.balance: User.balance + credit},
+        synchronize_session=False,
+    )
 
-    # Recompute prices: set to 1 for winning outcome and 0 for losing
+    # Recompute prices: set to 1 for winning outcome and 0 for losing. The
+    # response is built before the commit expires ``market``, so sending it
+    # does not reload the row.
     p_yes = 1.0 if outcome_upper == "YES" else 0.0
     p_no = 1.0 - p_yes
-    return MarketResponse(
+    response = MarketResponse.model_construct(
         id=market.id,
         title=market.title,
         description=market.description,
@@ -345,6 +580,9 @@ def resolve_market(request: ResolveRequest, db: Session = Depends(get_db)):
         price_yes=p_yes,
         price_no=p_no
     )
+    db.commit()
+    _invalidate_markets_cache()
+    return response
 
 
 @app.get("/user/{user_id}", response_model=UserResponse)
@@ -354,10 +592,18 @@ def get_user(user_id: int, db: Session = Depends(get_db)):
     Includes the current balance. Bets are not returned here to keep the
     response simple; they can be fetched via separate endpoints if needed.
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    row = db.query(User.id, User.username, User.balance).filter(User.id == user_id).first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return UserResponse(id=user.id, username=user.username, balance=user.balance)
+    return UserResponse.model_construct(id=row.id, username=row.username, balance=row.balance)
+
+
+@app.get("/metrics")
+def metrics():
+    """Return counters for the in-process ``/markets`` response cache."""
+    with _markets_cache_lock:
+        stats = dict(_markets_cache_stats)
+    return {"markets_cache": stats}
 
 
 @app.get("/")
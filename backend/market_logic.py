@@ -8,7 +8,24 @@ reflects the distribution of outstanding YES and NO shares.
 """
 
 import math
-from typing import Tuple
+
+import numpy as np
+
+
+def _log_add_exp(x: float, y: float) -> float:
+    """Return ``log(exp(x) + exp(y))`` without overflow.
+
+    The larger exponential is factored out of the sum, so the one term left
+    to evaluate is exp of a non-positive number.
+    """
+    return max(x, y) + math.log1p(math.exp(-abs(x - y)))
+
+
+def _log_sigmoid(x: float) -> float:
+    """Return ``log(1 / (1 + exp(-x)))`` without overflow."""
+    if x >= 0:
+        return -math.log1p(math.exp(-x))
+    return x - math.log1p(math.exp(x))
 
 
 def cost_function(q_yes: float, q_no: float, b: float) -> float:
@@ -23,12 +40,9 @@ def cost_function(q_yes: float, q_no: float, b: float) -> float:
     Returns:
         The value of the LMSR cost function C(q_yes, q_no).
     """
-    # Use exponentials of q/b. To prevent overflow for extreme values, we
-    # normalise by subtracting the maximum exponent from the numerator and
-    # denominator when computing the logarithm of the sum.
-    exp_yes = math.exp(q_yes / b)
-    exp_no = math.exp(q_no / b)
-    return b * math.log(exp_yes + exp_no)
+    # Use exponentials of q/b, summed in log space so that extreme values
+    # cannot overflow.
+    return b * _log_add_exp(q_yes / b, q_no / b)
 
 
 def cost_for_shares(q_yes: float, q_no: float, delta: float, side: str, b: float) -> float:
@@ -54,11 +68,26 @@ def cost_for_shares(q_yes: float, q_no: float, delta: float, side: str, b: float
         raise ValueError("side must be 'YES' or 'NO'")
 
     if side_upper == "YES":
-        new_cost = cost_function(q_yes + delta, q_no, b)
+        q_side, q_other = q_yes, q_no
     else:  # side_upper == 'NO'
-        new_cost = cost_function(q_yes, q_no + delta, b)
-    old_cost = cost_function(q_yes, q_no, b)
-    return new_cost - old_cost
+        q_side, q_other = q_no, q_yes
+    # C(q + delta) - C(q) simplifies to b * log(1 + (exp(r) - 1) * p), where
+    # r = delta / b and p is the current price of the side being bought.
+    r = delta / b
+    if r <= 1.0:
+        p_side = price_yes(q_side, q_other, b)
+        if r < 1e-4:
+            # For purchases that are tiny next to the liquidity, the
+            # second-order Taylor expansion in r is accurate to a relative
+            # error of about r**2 / 6 and skips both transcendentals.
+            return delta * p_side * (1.0 + 0.5 * r * (1.0 - p_side))
+        # log1p/expm1 keep small purchases accurate with two transcendentals.
+        return b * math.log1p(math.expm1(r) * p_side)
+    # For large purchases exp(r) overflows once r passes ~709, so add
+    # log(p) + r and log(1 - p) in log space instead. Both logs come straight
+    # from the share difference, so neither underflows to log(0).
+    lead = (q_side - q_other) / b
+    return b * _log_add_exp(r + _log_sigmoid(lead), _log_sigmoid(-lead))
 
 
 def price_yes(q_yes: float, q_no: float, b: float) -> float:
@@ -66,7 +95,10 @@ def price_yes(q_yes: float, q_no: float, b: float) -> float:
 
     Given the total YES and NO shares outstanding, the market price for YES is
     derived from the LMSR cost function as the proportion of the YES
-    exponential term to the total of both exponential terms.
+    exponential term to the total of both exponential terms. Dividing through
+    by the YES term gives the logistic form ``1 / (1 + exp((q_no - q_yes) / b))``,
+    which needs one exponential and only depends on the share difference, so
+    large but balanced share counts do not overflow.
 
     Args:
         q_yes: Total number of YES shares.
@@ -76,11 +108,46 @@ def price_yes(q_yes: float, q_no: float, b: float) -> float:
     Returns:
         A float between 0 and 1 representing the price/probability of YES.
     """
-    exp_yes = math.exp(q_yes / b)
-    exp_no = math.exp(q_no / b)
-    return exp_yes / (exp_yes + exp_no)
+    d = (q_yes - q_no) / b
+    # Only ever exponentiate a non-positive number: math.exp raises
+    # OverflowError past ~709, and the rearranged form for negative ``d``
+    # also keeps tiny YES prices accurate instead of rounding through 1 - p.
+    if d >= 0:
+        return 1.0 / (1.0 + math.exp(-d))
+    e = math.exp(d)
+    return e / (1.0 + e)
 
 
 def price_no(q_yes: float, q_no: float, b: float) -> float:
     """Compute the current market probability for the NO outcome."""
-    return 1.0 - price_yes(q_yes, q_no, b)
\ No newline at end of file
+    return price_yes(q_no, q_yes, b)
+
+
+def price_yes_batch(q_yes: np.ndarray, q_no: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Compute YES probabilities for many markets in one vectorised pass.
+
+    This is the elementwise equivalent of ``price_yes``, including its split
+    on the sign of the share difference, with a single exponential per
+    market. Inputs are not modified.
+
+    Args:
+        q_yes: Array of YES shares outstanding, one entry per market.
+        q_no: Array of NO shares outstanding.
+        b: Array of liquidity parameters.
+
+    Returns:
+        An array of floats between 0 and 1 with the YES price of each market.
+    """
+    # d = (q_yes - q_no) / b. As in ``price_yes`` only exp(-|d|) is ever
+    # evaluated, so NO leading by hundreds of ``b`` cannot overflow. The
+    # exponential is computed in place on a second buffer, and the result
+    # 1 / (1 + e) or e / (1 + e) is written back over ``d``.
+    d = np.subtract(q_yes, q_no, dtype=np.float64)
+    np.divide(d, b, out=d)
+    e = np.abs(d)
+    np.negative(e, out=e)
+    np.exp(e, out=e)
+    leads = d >= 0
+    np.add(e, 1.0, out=d)
+    np.divide(np.where(leads, 1.0, e), d, out=d)
+    return d
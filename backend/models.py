@@ -6,8 +6,8 @@ outline. Relationships are added to simplify joining users with their bets
 and markets with their bets.
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime, Text
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, DateTime, Text, Index, CheckConstraint
 from sqlalchemy.orm import relationship
 
 from backend.database import Base
@@ -19,10 +19,12 @@ class User(Base):
     Users have a unique username, a hashed password and a floating point
     balance. The default balance can be set when creating a new user in
     application logic; here we simply define the column with a default of
-    100.0. A relationship is provided to access the user's bets.
+    100.0. A relationship is provided to access the user's bets. A check
+    constraint keeps the balance from going negative.
     """
 
     __tablename__ = "users"
+    __table_args__ = (CheckConstraint("balance >= 0", name="ck_user_balance_non_negative"),)
 
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
@@ -37,10 +39,12 @@ class Market(Base):
 
     Each market tracks the amount of YES and NO shares outstanding along with
     a liquidity parameter ``b`` used in the LMSR cost function. Markets may
-    be unresolved or resolved to a particular outcome.
+    be unresolved or resolved to a particular outcome, which a check
+    constraint limits to 'YES' or 'NO'.
     """
 
     __tablename__ = "markets"
+    __table_args__ = (CheckConstraint("outcome IN ('YES', 'NO')", name="ck_market_outcome"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -61,10 +65,18 @@ class Bet(Base):
     Bets record the number of shares purchased, the side ('YES' or 'NO'),
     the total cost paid and the price per share at the time of purchase. A
     timestamp is automatically generated when the bet is inserted. Each bet
-    references both a user and a market via foreign keys.
+    references both a user and a market via foreign keys. A composite index
+    on ``(market_id, side)`` serves the payout aggregation when a market is
+    resolved, and check constraints reject unknown sides and non-positive
+    share amounts.
     """
 
     __tablename__ = "bets"
+    __table_args__ = (
+        Index("ix_bet_market_side", "market_id", "side"),
+        CheckConstraint("side IN ('YES', 'NO')", name="ck_bet_side"),
+        CheckConstraint("amount > 0", name="ck_bet_amount_positive"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -73,7 +85,7 @@ class Bet(Base):
     amount = Column(Float, nullable=False)  # Number of shares purchased
     price = Column(Float, nullable=False)   # Price per share at purchase
     total_cost = Column(Float, nullable=False)  # Total cost of the bet
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
 
     user = relationship("User", back_populates="bets")
     market = relationship("Market", back_populates="bets")
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Shared test setup.
+
+``backend.database`` builds its engine from ``DATABASE_URL`` at import time,
+so point it at a throwaway SQLite file before any backend module is loaded.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.database import Base, engine  # noqa: E402
+from backend import models  # noqa: E402,F401  (registers the tables)
+
+
+@pytest.fixture
+def db_tables():
+    """Give each test that touches the database a fresh schema."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
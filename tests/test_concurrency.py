@@ -0,0 +1,85 @@
+"""Concurrent bets and resolutions must not lose or duplicate updates."""
+
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from backend import main
+from backend.database import SessionLocal
+from backend.models import Bet, Market, User
+
+
+def _run_concurrently(count, target):
+    """Run ``target`` on ``count`` threads released together."""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run():
+        barrier.wait()
+        db = SessionLocal()
+        try:
+            target(db)
+        except HTTPException as exc:
+            errors.append(exc)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def _seed(balance=100.0):
+    db = SessionLocal()
+    db.add(User(username="alice", password_hash="x", balance=balance))
+    db.add(Market(title="Rain?", liquidity=100.0))
+    db.commit()
+    db.close()
+
+
+@pytest.mark.usefixtures("db_tables")
+def test_concurrent_bets_keep_shares_and_balance_consistent():
+    _seed(balance=1000.0)
+    bet = main.BetRequest(user_id=1, market_id=1, side="YES", amount=1)
+
+    def place(db):
+        for _ in range(10):
+            main.place_bet(bet, db=db)
+
+    errors = _run_concurrently(16, place)
+
+    db = SessionLocal()
+    try:
+        bets = db.query(Bet).all()
+        market = db.get(Market, 1)
+        user = db.get(User, 1)
+        assert errors == []
+        assert len(bets) == 160
+        assert market.yes_shares == sum(b.amount for b in bets)
+        assert user.balance == pytest.approx(1000.0 - sum(b.total_cost for b in bets))
+    finally:
+        db.close()
+
+
+@pytest.mark.usefixtures("db_tables")
+def test_concurrent_resolutions_pay_out_once():
+    _seed(balance=100.0)
+    db = SessionLocal()
+    main.place_bet(main.BetRequest(user_id=1, market_id=1, side="YES", amount=10), db=db)
+    balance_before = db.get(User, 1).balance
+    db.close()
+
+    resolve = main.ResolveRequest(market_id=1, outcome="YES")
+    errors = _run_concurrently(8, lambda db: main.resolve_market(resolve, db=db))
+
+    db = SessionLocal()
+    try:
+        assert len(errors) == 7
+        assert all(exc.status_code == 400 for exc in errors)
+        assert db.get(User, 1).balance == pytest.approx(balance_before + 10)
+    finally:
+        db.close()
@@ -0,0 +1,132 @@
+"""Numerical tests for the LMSR helpers in ``backend.market_logic``."""
+
+import math
+from decimal import Decimal, localcontext
+
+import numpy as np
+import pytest
+
+from backend.market_logic import (
+    cost_for_shares,
+    cost_function,
+    price_no,
+    price_yes,
+    price_yes_batch,
+)
+
+
+def _reference_cost(q_yes, q_no, b):
+    """LMSR cost evaluated with 60 significant digits."""
+    with localcontext() as ctx:
+        ctx.prec = 60
+        y, n, b = Decimal(q_yes), Decimal(q_no), Decimal(b)
+        return b * ((y / b).exp() + (n / b).exp()).ln()
+
+
+def _reference_trade(q_yes, q_no, delta, side, b):
+    """Exact-ish cost of buying ``delta`` shares, without cancellation."""
+    with localcontext() as ctx:
+        ctx.prec = 60
+        if side == "YES":
+            new = _reference_cost(q_yes + delta, q_no, b)
+        else:
+            new = _reference_cost(q_yes, q_no + delta, b)
+        return float(new - _reference_cost(q_yes, q_no, b))
+
+
+# Share states from balanced to lopsided in both directions.
+STATES = [(0.0, 0.0), (30.0, 10.0), (10.0, 30.0), (250.0, 0.0), (0.0, 250.0)]
+# The same with liquidity, plus markets lopsided far past exp's range.
+PRICED_STATES = [(y, n, 100.0) for y, n in STATES] + [
+    (0.0, 1e6, 1.0),
+    (1e6, 0.0, 1.0),
+    (3.0, 7.0, 0.5),
+]
+
+
+@pytest.mark.parametrize(
+    "q_yes, q_no, b",
+    [(1e6, 0.0, 100.0), (0.0, 1e6, 100.0), (1e6, 1e6, 100.0), (1000.0, 0.0, 1.0)],
+)
+def test_cost_function_does_not_overflow(q_yes, q_no, b):
+    assert cost_function(q_yes, q_no, b) == pytest.approx(
+        float(_reference_cost(q_yes, q_no, b)), rel=1e-15
+    )
+
+
+@pytest.mark.parametrize(
+    "q_yes, q_no, delta, side, b",
+    [
+        (1e6, 0.0, 10.0, "YES", 100.0),
+        (1e6, 0.0, 10.0, "NO", 100.0),
+        (0.0, 1e6, 1e5, "YES", 100.0),
+        (0.0, 0.0, 1000.0, "YES", 1.0),
+        (0.0, 0.0, 360.0, "NO", 0.5),
+    ],
+)
+def test_cost_for_shares_does_not_overflow(q_yes, q_no, delta, side, b):
+    cost = cost_for_shares(q_yes, q_no, delta, side, b)
+    assert math.isfinite(cost)
+    assert cost == pytest.approx(_reference_trade(q_yes, q_no, delta, side, b), rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("side", ["YES", "NO"])
+@pytest.mark.parametrize("q_yes, q_no", STATES)
+@pytest.mark.parametrize(
+    "r, rel",
+    [
+        # Either side of the Taylor fast path, whose truncation error is
+        # about r**2 / 6.
+        (0.99e-4, 2e-9),
+        (1e-4, 1e-12),
+        (1.01e-4, 1e-12),
+        # Either side of the switch to log-space evaluation.
+        (0.999, 1e-12),
+        (1.0, 1e-12),
+        (1.001, 1e-12),
+        (50.0, 1e-12),
+    ],
+)
+def test_cost_for_shares_matches_reference_across_branches(q_yes, q_no, side, r, rel):
+    b = 100.0
+    delta = r * b
+    assert cost_for_shares(q_yes, q_no, delta, side, b) == pytest.approx(
+        _reference_trade(q_yes, q_no, delta, side, b), rel=rel
+    )
+
+
+def test_cost_for_shares_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        cost_for_shares(0.0, 0.0, 0.0, "YES", 100.0)
+    with pytest.raises(ValueError):
+        cost_for_shares(0.0, 0.0, 1.0, "MAYBE", 100.0)
+
+
+@pytest.mark.parametrize("q_yes, q_no, b", PRICED_STATES)
+def test_prices_sum_to_one(q_yes, q_no, b):
+    p_yes = price_yes(q_yes, q_no, b)
+    p_no = price_no(q_yes, q_no, b)
+    assert 0.0 <= p_yes <= 1.0
+    assert p_yes + p_no == pytest.approx(1.0, abs=1e-15)
+
+
+def test_price_yes_overflow_inputs():
+    assert price_yes(0.0, 1e6, 1.0) == 0.0
+    assert price_yes(1e6, 0.0, 1.0) == 1.0
+
+
+def test_price_yes_batch_matches_scalar_and_leaves_inputs_alone():
+    q_yes = np.array([y for y, _, _ in PRICED_STATES])
+    q_no = np.array([n for _, n, _ in PRICED_STATES])
+    b = np.array([b for _, _, b in PRICED_STATES])
+    originals = (q_yes.copy(), q_no.copy(), b.copy())
+
+    # Overflow would mean a positive argument reached exp; underflow to 0
+    # for the far-behind side is expected.
+    with np.errstate(over="raise", invalid="raise", divide="raise"):
+        batch = price_yes_batch(q_yes, q_no, b)
+
+    expected = [price_yes(y, n, l) for y, n, l in PRICED_STATES]
+    np.testing.assert_allclose(batch, expected, rtol=1e-15, atol=0.0)
+    for array, original in zip((q_yes, q_no, b), originals):
+        np.testing.assert_array_equal(array, original)
@@ -0,0 +1,34 @@
+"""The ``/markets`` cache must never pair a listing with the wrong ETag."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+
+
+@pytest.fixture
+def client(db_tables):
+    main._invalidate_markets_cache()
+    with TestClient(main.app) as c:
+        yield c
+    main._invalidate_markets_cache()
+
+
+def test_etag_changes_with_the_body_even_if_the_version_lags(client, monkeypatch):
+    client.post("/register", json={"username": "alice", "password": "secret"})
+    client.post("/markets", json={"title": "A"})
+    before = client.get("/markets")
+    main._invalidate_markets_cache()
+
+    # Simulate the version query running before a bet commits and the
+    # listing running after it.
+    version = main._market_state_version
+    monkeypatch.setattr(main, "_market_state_version", lambda db: (0, 1, 0))
+    client.post("/bet", json={"user_id": 1, "market_id": 1, "side": "YES", "amount": 5})
+    main._invalidate_markets_cache()
+    after = client.get("/markets")
+    monkeypatch.setattr(main, "_market_state_version", version)
+
+    assert after.json()[0]["yes_shares"] == 5
+    assert after.headers["etag"] != before.headers["etag"]
+    assert client.get("/markets", headers={"If-None-Match": before.headers["etag"]}).status_code == 200